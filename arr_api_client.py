@@ -2,15 +2,50 @@
 """
 Client API pour Radarr/Sonarr - Refresh, Scan et Search automatiques
 """
+import functools
+import json
 import os
 import re
 import logging
 import requests
-from typing import Optional, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 
+# Sérialisation des payloads: orjson si disponible
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson refuse les surrogates (chemins non UTF-8): json les échappe
+            return json.dumps(obj).encode()
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
+# Nom de dossier 'Titre (Année)'
+_TITLE_YEAR_RE = re.compile(r'^(.*)\s+\((\d{4})\)$')
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_title_year(folder_name: str) -> tuple[Optional[str], Optional[int]]:
+    """
+    Extrait titre et année depuis nom de dossier
+    Ex: 'The Whale (2022)' -> ('The Whale', 2022)
+    
+    Mis en cache: les épisodes d'une même série partagent le même dossier.
+    """
+    match = _TITLE_YEAR_RE.match(folder_name)
+    if match:
+        return match.group(1).strip(), int(match.group(2))
+    return None, None
+
 
 @dataclass
 class ArrConfig:
@@ -29,10 +64,29 @@ class ArrAPIClient:
         self.session = requests.Session()
         self.session.headers.update({
             'X-Api-Key': config.api_key,
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
         })
+        
+        # Pool élargi (appels parallèles) + retry sur erreurs transitoires
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"])
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.base_url = config.api_url.rstrip('/')
         
+        # Index des bibliothèques, chargés une seule fois par run
+        self._movie_index: Optional[Dict[Tuple[str, int], Dict]] = None
+        self._series_index: Optional[Dict[str, Dict]] = None
+        
     def _get(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """GET request générique"""
         try:
@@ -48,101 +102,122 @@ class ArrAPIClient:
         """POST request générique"""
         try:
             url = f"{self.base_url}/api/v3/{endpoint}"
-            response = self.session.post(url, json=data, timeout=10)
+            # Corps pré-sérialisé (Content-Type déjà posé sur la session)
+            response = self.session.post(url, data=_json_dumps(data), timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
             logger.error(f"[{self.config.name}] POST {endpoint} failed: {e}")
             return None
     
-    @staticmethod
-    def parse_title_year(folder_name: str) -> tuple[Optional[str], Optional[int]]:
+    parse_title_year = staticmethod(parse_title_year)
+    
+    def invalidate_cache(self):
+        """Vide les index films/séries (process longue durée)"""
+        self._movie_index = None
+        self._series_index = None
+    
+    def _get_movie_index(self) -> Dict[Tuple[str, int], Dict]:
+        """
+        Charge et indexe la liste des films Radarr par (titre, année)
+        
+        Un seul GET par run, même en échec ou bibliothèque vide (index vide
+        conservé). En cas de doublon, le premier film est retenu.
+        """
+        if self._movie_index is None:
+            self._movie_index = {}
+            for item in self._get("movie") or []:
+                self._movie_index.setdefault((item.get('title'), item.get('year')), item)
+        return self._movie_index
+    
+    def _get_series_index(self) -> Dict[str, Dict]:
         """
-        Extrait titre et année depuis nom de dossier
-        Ex: 'The Whale (2022)' -> ('The Whale', 2022)
+        Charge et indexe la liste des séries Sonarr par titre
+        
+        Un seul GET par run, même en échec ou bibliothèque vide (index vide
+        conservé). En cas de doublon, la première série est retenue.
         """
-        match = re.match(r'^(.*)\s+\((\d{4})\)$', folder_name)
-        if match:
-            return match.group(1).strip(), int(match.group(2))
-        return None, None
+        if self._series_index is None:
+            self._series_index = {}
+            for item in self._get("series") or []:
+                self._series_index.setdefault(item.get('title'), item)
+        return self._series_index
     
     def find_movie_by_title_year(self, title: str, year: int) -> Optional[Dict]:
         """Recherche film dans Radarr par titre+année"""
-        endpoint = "movie"
-        items = self._get(endpoint)
+        item = self._get_movie_index().get((title, year))
         
-        if not items:
-            return None
-            
-        for item in items:
-            if item.get('title') == title and item.get('year') == year:
-                logger.info(f"[{self.config.name}] Trouvé: {title} ({year}) - ID: {item.get('id')}")
-                return item
+        if item:
+            logger.info(f"[{self.config.name}] Trouvé: {title} ({year}) - ID: {item.get('id')}")
+            return item
                 
         logger.warning(f"[{self.config.name}] Aucun média trouvé pour: {title} ({year})")
         return None
     
     def find_series_by_title(self, title: str) -> Optional[Dict]:
         """Recherche série dans Sonarr par titre (pas d'année pour séries)"""
-        endpoint = "series"
-        items = self._get(endpoint)
+        item = self._get_series_index().get(title)
         
-        if not items:
-            return None
-            
-        for item in items:
-            if item.get('title') == title:
-                logger.info(f"[{self.config.name}] Trouvé: {title} - ID: {item.get('id')}")
-                return item
+        if item:
+            logger.info(f"[{self.config.name}] Trouvé: {title} - ID: {item.get('id')}")
+            return item
                 
         logger.warning(f"[{self.config.name}] Aucune série trouvée pour: {title}")
         return None
     
-    def refresh_and_scan(self, item_id: int) -> bool:
-        """Refresh metadata + Rescan disk"""
-        command_name = "RefreshMovie" if self.config.category == "films" else "RefreshSeries"
-        id_key = "movieIds" if self.config.category == "films" else "seriesIds"
+    def _command_ids_key(self) -> str:
+        """Clé des IDs dans le payload des commandes"""
+        return "movieIds" if self.config.category == "films" else "seriesIds"
+    
+    def refresh_and_scan_bulk(self, item_ids: List[int]) -> bool:
+        """Refresh metadata + Rescan disk pour plusieurs médias en une commande"""
+        if not item_ids:
+            return True
         
         data = {
-            "name": command_name,
-            id_key: [item_id]
+            "name": "RefreshMovie" if self.config.category == "films" else "RefreshSeries",
+            self._command_ids_key(): list(item_ids)
         }
         
         result = self._post("command", data)
         if result:
-            logger.info(f"[{self.config.name}] Refresh+Scan lancé pour ID {item_id} (command_id={result.get('id')})")
+            logger.info(f"[{self.config.name}] Refresh+Scan lancé pour {len(item_ids)} ID(s) (command_id={result.get('id')})")
             return True
         return False
     
-    def search_missing(self, item_id: int) -> bool:
-        """Lance recherche automatique pour média manquant"""
-        if self.config.category == "films":
-            command_name = "MoviesSearch"
-            id_key = "movieIds"
-        else:
-            command_name = "SeriesSearch"
-            id_key = "seriesIds"
+    def search_missing_bulk(self, item_ids: List[int]) -> bool:
+        """Lance recherche automatique pour plusieurs médias en une commande"""
+        if not item_ids:
+            return True
         
         data = {
-            "name": command_name,
-            id_key: [item_id]
+            "name": "MoviesSearch" if self.config.category == "films" else "SeriesSearch",
+            self._command_ids_key(): list(item_ids)
         }
         
         result = self._post("command", data)
         if result:
-            logger.info(f"[{self.config.name}] Recherche lancée pour ID {item_id} (command_id={result.get('id')})")
+            logger.info(f"[{self.config.name}] Recherche lancée pour {len(item_ids)} ID(s) (command_id={result.get('id')})")
             return True
         return False
     
-    def process_broken_symlink(self, symlink_path: str) -> bool:
+    def refresh_and_scan(self, item_id: int) -> bool:
+        """Refresh metadata + Rescan disk"""
+        return self.refresh_and_scan_bulk([item_id])
+    
+    def search_missing(self, item_id: int) -> bool:
+        """Lance recherche automatique pour média manquant"""
+        return self.search_missing_bulk([item_id])
+    
+    def resolve_item_id(self, symlink_path: str) -> Optional[int]:
         """
-        Pipeline complet: Parse → Find → Refresh → Search
+        Résout l'ID Radarr/Sonarr du média d'un symlink cassé: Parse → Find
         
         Args:
             symlink_path: Chemin complet du symlink cassé
         
         Returns:
-            True si traité avec succès
+            ID du média, ou None si introuvable
         """
         # Extraire nom du dossier parent
         folder_name = os.path.basename(os.path.dirname(symlink_path))
@@ -151,7 +226,7 @@ class ArrAPIClient:
         title, year = self.parse_title_year(folder_name)
         if not title:
             logger.warning(f"[{self.config.name}] Impossible de parser: {folder_name}")
-            return False
+            return None
         
         # Trouver dans Radarr/Sonarr
         if self.config.category == "films" and year:
@@ -160,19 +235,30 @@ class ArrAPIClient:
             item = self.find_series_by_title(title)
         
         if not item:
-            return False
+            return None
         
-        item_id = item.get('id')
-        if not item_id:
-            return False
+        return item.get('id')
+    
+    def process_item_ids(self, item_ids: List[int]) -> bool:
+        """
+        Pipeline groupé: Refresh → Search, une commande de chaque par instance
+        
+        Args:
+            item_ids: IDs des médias dont un symlink a été supprimé
+        
+        Returns:
+            True si les deux commandes ont été acceptées
+        """
+        if not item_ids:
+            return True
         
         # Refresh + Scan
-        if not self.refresh_and_scan(item_id):
+        if not self.refresh_and_scan_bulk(item_ids):
             return False
         
         # Recherche automatique
-        if not self.search_missing(item_id):
+        if not self.search_missing_bulk(item_ids):
             return False
         
-        logger.info(f"[{self.config.name}] Pipeline complet OK pour: {title} ({year if year else 'série'})")
+        logger.info(f"[{self.config.name}] Pipeline complet OK pour {len(item_ids)} média(s)")
         return True
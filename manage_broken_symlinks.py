@@ -18,36 +18,117 @@ Exit codes:
 """
 
 import argparse
+import errno
+import functools
+import hashlib
 import json
 import logging
 import logging.handlers
 import os
+import stat
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from itertools import groupby, islice, repeat
 from pathlib import Path
-from typing import List, Dict, Optional
-import yaml
+from types import ModuleType, SimpleNamespace
+from typing import TYPE_CHECKING, Iterator, List, Dict, Optional
 
+if TYPE_CHECKING:
+    from arr_api_client import ArrAPIClient
+
+# Sérialisation JSON: orjson si disponible (plus rapide, produit des bytes)
 try:
-    from arr_api_client import ArrAPIClient, ArrConfig
-    API_CLIENT_AVAILABLE = True
+    import orjson
+    
+    def _json_dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson refuse les surrogates (noms de fichiers non UTF-8
+            # décodés par os.fsdecode): json les échappe
+            return json.dumps(obj).encode()
 except ImportError:
-    API_CLIENT_AVAILABLE = False
-    print("WARNING: arr_api_client module not available, API actions disabled", file=sys.stderr)
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 
-# Import Rich avec fallback gracieux
-try:
-    from rich.console import Console
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich import box
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    print("[WARNING] Rich library not available, using plain output", file=sys.stderr)
+# ============================================================================
+# IMPORTS À LA DEMANDE
+# ============================================================================
+# rich, yaml et requests coûtent à eux seuls l'essentiel du démarrage: ils ne
+# sont importés que par les chemins qui s'en servent (TTY, config, API).
+
+@functools.cache
+def load_rich() -> Optional[SimpleNamespace]:
+    """Importe Rich au premier besoin, avec fallback gracieux"""
+    try:
+        from rich.console import Console
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich import box
+    except ImportError:
+        print("[WARNING] Rich library not available, using plain output", file=sys.stderr)
+        return None
+    
+    return SimpleNamespace(
+        Console=Console,
+        Progress=Progress,
+        SpinnerColumn=SpinnerColumn,
+        TextColumn=TextColumn,
+        Panel=Panel,
+        Table=Table,
+        box=box
+    )
+
+
+@functools.cache
+def load_api_client() -> Optional[ModuleType]:
+    """Importe arr_api_client (et requests) uniquement si les actions API sont activées"""
+    try:
+        import arr_api_client
+    except ImportError:
+        print("WARNING: arr_api_client module not available, API actions disabled", file=sys.stderr)
+        return None
+    
+    return arr_api_client
+
+
+@functools.cache
+def get_console():
+    """Console Rich (stderr) unique pour tout le process, créée au premier besoin"""
+    return load_rich().Console(stderr=True)
+
+
+def rich_enabled(config: "Config") -> bool:
+    """Sortie Rich si TTY, progression demandée et Rich installé"""
+    return (
+        _STDERR_ISATTY
+        and config.scan_options.get('show_progress', True)
+        and load_rich() is not None
+    )
+
+
+# stderr est-il un terminal (un seul appel isatty par process)
+_STDERR_ISATTY = sys.stderr.isatty()
+
+# Dossier du script et configuration par défaut
+_HERE = Path(__file__).resolve().parent
+_DEFAULT_CONFIG = _HERE / 'config.yaml'
+
+# Logger applicatif (handlers configurés par setup_logging)
+_LOGGER = logging.getLogger('broken-symlinks')
+
+# Symlinks soumis à la fois au pool de vérification (mémoire bornée)
+CHECK_BATCH_SIZE = 256
+
+# Erreurs de stat signifiant une cible inexistante (mêmes que Path.exists)
+BROKEN_TARGET_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.ELOOP})
 
 
 # ============================================================================
@@ -74,14 +155,24 @@ class ScanResult:
     instance: str
     category: str
     total_checked: int
-    broken_links: List[Path]
+    broken_links: List[str]
     duration: float
+    stalled: bool = False  # Montage figé: instance non analysée
     
     @property
     def broken_count(self) -> int:
         return len(self.broken_links)
 
 
+@dataclass
+class MountStatus:
+    """État d'un montage, sondé une seule fois par run"""
+    stalled: bool
+    exists: bool = False
+    is_mount: bool = False
+    readable: bool = False
+
+
 @dataclass
 class Config:
     """Configuration globale chargée depuis YAML"""
@@ -93,9 +184,40 @@ class Config:
     @classmethod
     def from_yaml(cls, path: Path) -> "Config":
         """Charge la config depuis un fichier YAML"""
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+        return cls.from_dict(read_yaml(path))
+    
+    @classmethod
+    def load(cls, path: Path) -> "Config":
+        """
+        Charge la config, sans parser le YAML s'il n'a pas changé
+        
+        Le contenu parsé est mis en cache en JSON (pas de pickle: rien n'est
+        exécuté au chargement), avec pour clé (st_mtime_ns, st_size) du
+        fichier. Toute erreur de cache retombe sur le parse YAML.
+        """
+        try:
+            st = os.stat(path)
+            key = [st.st_mtime_ns, st.st_size]
+            # Path.home() lève RuntimeError si HOME est introuvable
+            cache_path = config_cache_path(path)
+        except (OSError, RuntimeError, KeyError):
+            # Fichier absent compris: read_yaml lève l'erreur attendue par main
+            return cls.from_dict(read_yaml(path))
         
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if cached['key'] == key:
+                return cls.from_dict(cached['data'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        data = read_yaml(path)
+        write_config_cache(cache_path, key, data)
+        return cls.from_dict(data)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Config":
+        """Construit la config depuis le contenu parsé du YAML"""
         instances = [
             DebridInstance(
                 name=inst['name'],
@@ -116,6 +238,51 @@ class Config:
         )
 
 
+def read_yaml(path: Path) -> Dict:
+    """Parse un fichier YAML (yaml importé au premier besoin)"""
+    import yaml
+    
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+
+def config_cache_path(path: Path) -> Path:
+    """Fichier de cache de la config, propre à l'utilisateur et au chemin résolu"""
+    cache_dir = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'manage_broken_symlinks'
+    digest = hashlib.sha1(os.fsencode(Path(path).resolve())).hexdigest()
+    return cache_dir / f"config_{digest}.json"
+
+
+def write_config_cache(cache_path: Path, key: List[int], data: Dict):
+    """
+    Écrit le cache de config (best effort)
+    
+    Fichier en 0600 (il contient les clés API), remplacé atomiquement.
+    """
+    # json standard, pas orjson (qui convertit les dates en str); relu pour
+    # vérifier que le cache rendra exactement les données du YAML
+    try:
+        payload = json.dumps({"key": key, "data": data}).encode()
+        if json.loads(payload)["data"] != data:
+            # Valeurs YAML altérées par JSON (clés entières...): pas de cache
+            return
+    except (TypeError, ValueError):
+        # Valeurs YAML non sérialisables en JSON (dates...): pas de cache
+        return
+    
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
 
 # ============================================================================
 # LOGGING
@@ -127,34 +294,69 @@ class JSONLogger:
     def __init__(self, log_dir: Path, enabled: bool = True):
         self.enabled = enabled
         self.log_file: Optional[Path] = None
+        self._fh = None
+        self._lock = threading.Lock()  # Scans parallèles
+        self._ts_cache = (0, "")  # (seconde, préfixe ISO) du dernier horodatage
         
         if enabled:
             log_dir.mkdir(parents=True, exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.log_file = log_dir / f"scan_{timestamp}.jsonl"
+            # Fichier ouvert une seule fois, bufferisé: écrit par blocs de 64 Ko,
+            # vidé aux bornes de chaque scan (flush) et à la fermeture
+            self._fh = open(self.log_file, 'ab', buffering=64 * 1024)
     
     def log(self, event: str, level: str = "INFO", **kwargs):
         """Écrit un événement JSON"""
-        if not self.enabled or not self.log_file:
+        if not self.enabled or not self._fh:
             return
         
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(),
             "level": level,
             "event": event,
             **kwargs
         }
         
-        with open(self.log_file, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+        line = _json_dumps(entry) + b'\n'
+        with self._lock:
+            self._fh.write(line)
+    
+    def _timestamp(self) -> str:
+        """Horodatage ISO local, le préfixe à la seconde n'est formaté qu'une fois"""
+        now = time.time()
+        second = int(now)
+        cached = self._ts_cache
+        if cached[0] != second:
+            cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second)))
+            self._ts_cache = cached
+        return f"{cached[1]}.{int((now - second) * 1_000_000):06d}"
+    
+    def flush(self):
+        """
+        Vide le buffer sur disque
+        
+        Appelé aux bornes de scan: un process tué pendant un scan bloqué
+        (SIGTERM de cron/systemd) ne passe pas par close().
+        """
+        with self._lock:
+            if self._fh:
+                self._fh.flush()
     
-    def log_broken(self, path: Path, target: Path, instance: str, category: str):
+    def close(self):
+        """Ferme le fichier de log"""
+        with self._lock:
+            if self._fh:
+                self._fh.close()
+                self._fh = None
+    
+    def log_broken(self, path: str, target: str, instance: str, category: str):
         """Log spécifique pour symlink cassé"""
         self.log(
             event="broken_symlink",
             level="WARNING",
-            path=str(path),
-            target=str(target),
+            path=path,
+            target=target,
             instance=instance,
             category=category
         )
@@ -164,7 +366,7 @@ def setup_logging(config: Config) -> tuple[logging.Logger, JSONLogger]:
     """Configure le système de logging (console + syslog + JSON)"""
     
     # Logger Python standard
-    logger = logging.getLogger('broken-symlinks')
+    logger = _LOGGER
     logger.setLevel(logging.INFO)
     
     # Handler console
@@ -201,17 +403,186 @@ def setup_logging(config: Config) -> tuple[logging.Logger, JSONLogger]:
 # SCANNER
 # ============================================================================
 
+# Opérations relatives à un fd de dossier disponibles (Linux, BSD)
+DIR_FD_SUPPORTED = (
+    os.scandir in os.supports_fd
+    and os.readlink in os.supports_dir_fd
+    and os.stat in os.supports_dir_fd
+)
+
+
+def iter_symlinks(root: bytes, use_dir_fd: bool = False) -> Iterator[tuple[Optional[int], bytes, bytes]]:
+    """
+    Parcourt récursivement root et émet chaque symlink rencontré
+    
+    os.scandir fournit le type de chaque entrée depuis la lecture du
+    répertoire: pas de lstat ni d'objet Path par entrée. Les chemins sont en
+    bytes (pas de décodage UTF-8). Les symlinks vers des répertoires ne sont
+    pas suivis.
+    
+    Émet (dir_fd, nom, chemin). Avec use_dir_fd, dir_fd est un fd ouvert sur
+    le dossier parent (valide jusqu'à l'élément suivant) et nom le nom
+    relatif: readlink/stat n'ont plus à résoudre le chemin complet. Sinon
+    dir_fd vaut None et nom est le chemin complet.
+    """
+    stack = [root]
+    
+    while stack:
+        directory = stack.pop()
+        fd = None
+        try:
+            if use_dir_fd:
+                fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            with os.scandir(directory if fd is None else fd) as it:
+                for entry in it:
+                    if entry.is_symlink():
+                        # scandir(fd) produit des noms str: réencodés en bytes
+                        name = entry.name if fd is None else os.fsencode(entry.name)
+                        path = os.path.join(directory, name)
+                        yield fd, name if fd is not None else path, path
+                    elif entry.is_dir(follow_symlinks=False):
+                        name = entry.name if fd is None else os.fsencode(entry.name)
+                        stack.append(os.path.join(directory, name))
+        except OSError:
+            # Répertoire illisible (permissions, disparu pendant le scan)
+            continue
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+
+def probe_mount(path: Path, timeout: float) -> Optional[bool]:
+    """
+    Vérifie que le montage répond en listant sa racine dans un thread
+    
+    Un montage FUSE figé (AllDebrid rate-limité) bloque les appels système
+    indéfiniment: le thread de sonde est abandonné après timeout secondes.
+    
+    Returns:
+        True si listable, False si erreur (absent, permissions), None si figé
+    """
+    result: List[bool] = []
+    
+    def _probe():
+        try:
+            with os.scandir(path) as it:
+                next(it, None)
+            result.append(True)
+        except OSError:
+            result.append(False)
+    
+    thread = threading.Thread(target=_probe, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    
+    return result[0] if result else None
+
+
+class NullProgress:
+    """Substitut sans affichage de rich.progress.Progress (même API utilisée)"""
+    
+    def __enter__(self) -> "NullProgress":
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def add_task(self, description: str, total: Optional[int] = None) -> int:
+        return 0
+    
+    def update(self, task_id: int, advance: int = 0):
+        pass
+
+
 class SymlinkScanner:
     """Scanner de symlinks cassés"""
     
-    def __init__(self, config: Config, logger: logging.Logger, json_logger: JSONLogger):
+    def __init__(self, config: Config, logger: logging.Logger, json_logger: JSONLogger, use_rich: bool, workers: Optional[int] = None):
         self.config = config
         self.logger = logger
         self.json_logger = json_logger
-        self.use_rich = RICH_AVAILABLE and sys.stderr.isatty() and config.scan_options.get('show_progress', True)
+        self.use_rich = use_rich
+        
+        # Scan des instances en parallèle (I/O-bound), hors affichage Rich:
+        # panneaux et barres de progression des instances s'entremêleraient
+        self.parallel = (
+            len(config.instances) > 1
+            and config.scan_options.get('parallel_scan', True)
+            and not use_rich
+        )
+        
+        # readlink/stat relatifs au dossier parent plutôt que par chemin complet
+        self.use_dir_fd = DIR_FD_SUPPORTED and config.scan_options.get('use_dir_fd', True)
+        
+        # Threads de vérification des symlinks par instance (1: séquentiel),
+        # --workers prime sur la configuration
+        if workers is None:
+            workers = config.scan_options.get('workers', 1)
+        if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+            logger.warning(f"Valeur workers invalide ({workers!r}), vérification séquentielle")
+            workers = 1
+        self.workers = workers
+        
+        # Sonde unique par montage, partagée par les vérifications et le scan
+        self._mount_status: Dict[Path, MountStatus] = {}
         
         if self.use_rich:
-            self.console = Console(stderr=True)
+            self.console = get_console()
+    
+    def _progress(self):
+        """Progress Rich (spinner + compteur) ou NullProgress si pas d'affichage"""
+        if not self.use_rich:
+            return NullProgress()
+        
+        rich = load_rich()
+        return rich.Progress(
+            rich.SpinnerColumn(),
+            rich.TextColumn("[progress.description]{task.description}"),
+            rich.TextColumn("{task.completed} symlinks"),
+            console=self.console
+        )
+    
+    def get_mount_status(self, mount_path: Path) -> MountStatus:
+        """Sonde un montage (une seule fois par run) et met le résultat en cache"""
+        
+        status = self._mount_status.get(mount_path)
+        if status is not None:
+            return status
+        
+        timeout = self.config.scan_options.get('mount_probe_timeout', 5)
+        if probe_mount(mount_path, timeout) is None:
+            # Ne plus toucher au montage: exists/ismount/access bloqueraient
+            status = MountStatus(stalled=True)
+        else:
+            status = MountStatus(
+                stalled=False,
+                exists=mount_path.exists(),
+                is_mount=os.path.ismount(str(mount_path)),
+                readable=os.access(str(mount_path), os.R_OK)
+            )
+        
+        self._mount_status[mount_path] = status
+        return status
+    
+    def scan_all(self) -> List[ScanResult]:
+        """Scan toutes les instances (en parallèle si activé), dans l'ordre de la config"""
+        
+        if not self.parallel:
+            return [self.scan_instance(instance) for instance in self.config.instances]
+        
+        instances = self.config.instances
+        max_workers = min(len(instances), (os.cpu_count() or 1) * 4)
+        results: List[Optional[ScanResult]] = [None] * len(instances)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Future -> rang de l'instance dans la config
+            futures = {executor.submit(self.scan_instance, instance): i for i, instance in enumerate(instances)}
+            
+            # Résultats collectés au fil de l'eau; une erreur remonte dès qu'elle survient
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
     
     def check_prerequisites(self) -> bool:
         """Vérifie que tous les prérequis sont OK"""
@@ -228,23 +599,34 @@ class SymlinkScanner:
             return False
         
         # Vérifier chaque montage
+        stalled = 0
         for instance in self.config.instances:
-            if not instance.mount_path.exists():
+            status = self.get_mount_status(instance.mount_path)
+            
+            # Montage figé: signalé, l'instance sera ignorée au scan
+            if status.stalled:
+                self.logger.warning(f"Montage {instance.name} ne répond pas: {instance.mount_path}")
+                stalled += 1
+                continue
+            
+            if not status.exists:
                 self.logger.error(f"Montage {instance.name} inexistant: {instance.mount_path}")
                 self.json_logger.log("error", level="ERROR", message="mount_missing", instance=instance.name, path=str(instance.mount_path))
                 return False
             
             # Vérifier si vraiment monté
-            if not os.path.ismount(str(instance.mount_path)):
+            if not status.is_mount:
                 self.logger.warning(f"Montage {instance.name} non actif: {instance.mount_path}")
             
             # Vérifier permissions
-            if not os.access(str(instance.mount_path), os.R_OK):
+            if not status.readable:
                 self.logger.error(f"Montage {instance.name} non accessible en lecture: {instance.mount_path}")
                 self.json_logger.log("error", level="ERROR", message="mount_permission_denied", instance=instance.name, path=str(instance.mount_path))
                 return False
         
-        if self.use_rich:
+        if stalled:
+            self.logger.warning(f"Montages vérifiés: {stalled} figé(s), instance(s) ignorée(s) au scan")
+        elif self.use_rich:
             self.console.print("[green]✓[/green] Montages vérifiés avec succès\n")
         else:
             self.logger.info("Montages vérifiés avec succès")
@@ -257,16 +639,17 @@ class SymlinkScanner:
         start_time = datetime.now()
         
         if self.use_rich:
-            panel = Panel(
+            rich = load_rich()
+            panel = rich.Panel(
                 f"[bold]{instance.category.upper()}[/bold] ({instance.name})",
-                box=box.ROUNDED,
+                box=rich.box.ROUNDED,
                 style="cyan"
             )
             self.console.print(panel)
             self.console.print(f"Montage cible: [yellow]{instance.mount_path}[/yellow]\n")
         else:
-            self.logger.info(f"=== SCAN {instance.category.upper()} ===")
-            self.logger.info(f"Montage cible: {instance.mount_path}")
+            self.logger.info(f"=== SCAN {instance.category.upper()} ({instance.name}) ===")
+            self.logger.info(f"[{instance.name}] Montage cible: {instance.mount_path}")
         
         self.json_logger.log(
             "scan_started",
@@ -274,78 +657,96 @@ class SymlinkScanner:
             category=instance.category,
             mount_path=str(instance.mount_path)
         )
+        self.json_logger.flush()
         
-        broken_links: List[Path] = []
+        broken_links: List[str] = []
         total_checked = 0
+        mount_prefix = os.fsencode(instance.mount_path)
         
-        for folder in instance.media_folders:
-            folder_path = self.config.media_dir / folder
-            
-            if not folder_path.exists():
-                self.logger.warning(f"Dossier ignoré (inexistant): {folder_path}")
-                continue
-            
-            # Collecter tous les symlinks
-            symlinks = list(folder_path.rglob('*'))
-            symlinks = [p for p in symlinks if p.is_symlink()]
-            
-            if not symlinks:
-                if self.use_rich:
-                    self.console.print(f"  {folder}/ [dim](aucun symlink)[/dim]")
-                else:
-                    self.logger.info(f"  {folder}/ (aucun symlink)")
-                continue
-            
-            # Scanner avec barre de progression
-            folder_broken = []
-            
-            if self.use_rich:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TaskProgressColumn(),
-                    console=self.console
-                ) as progress:
-                    task = progress.add_task(f"Analyse {folder}/", total=len(symlinks))
-                    
-                    for link in symlinks:
-                        total_checked += 1
-                        if self._is_broken_symlink(link, instance.mount_path):
-                            folder_broken.append(link)
-                            broken_links.append(link)
-                        progress.update(task, advance=1)
-            else:
-                self.logger.info(f"Analyse: {folder}/ ({len(symlinks)} symlinks)")
-                for link in symlinks:
-                    total_checked += 1
-                    if self._is_broken_symlink(link, instance.mount_path):
-                        folder_broken.append(link)
-                        broken_links.append(link)
-            
-            # Afficher résultat dossier
-            if folder_broken:
-                if self.use_rich:
-                    self.console.print(f"  [red]✗[/red] {folder}/: {len(folder_broken)} cassé(s) sur {len(symlinks)}")
-                    for broken in folder_broken:
-                        self.console.print(f"    [red]❌ {broken}[/red]")
-                else:
-                    self.logger.warning(f"  {folder}/: {len(folder_broken)} cassé(s) sur {len(symlinks)}")
-                    for broken in folder_broken:
-                        self.logger.warning(f"[CASSÉ] {broken}")
-            else:
-                if self.use_rich:
-                    self.console.print(f"  [green]✓[/green] {folder}/: {len(symlinks)} symlinks OK")
+        # Montage figé: chaque stat bloquerait sur FUSE, on n'analyse pas
+        if self.get_mount_status(instance.mount_path).stalled:
+            probe_timeout = self.config.scan_options.get('mount_probe_timeout', 5)
+            self.logger.warning(f"Montage {instance.name} ne répond pas en {probe_timeout}s, scan ignoré: {instance.mount_path}")
+            self.json_logger.log("mount_stalled", level="WARNING", instance=instance.name, path=str(instance.mount_path), timeout_seconds=probe_timeout)
+            self.json_logger.flush()
+            return ScanResult(
+                instance=instance.name,
+                category=instance.category,
+                total_checked=0,
+                broken_links=[],
+                duration=(datetime.now() - start_time).total_seconds(),
+                stalled=True
+            )
+        
+        # Pool borné pour les vérifications (None: séquentiel)
+        executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        
+        # Une seule Progress pour tous les dossiers de l'instance
+        with self._progress() as progress, executor or nullcontext():
+            for folder in instance.media_folders:
+                folder_path = self.config.media_dir / folder
+                
+                if not folder_path.exists():
+                    self.logger.warning(f"[{instance.name}] Dossier ignoré (inexistant): {folder_path}")
+                    continue
+                
+                # Scanner en flux (aucune liste de symlinks en mémoire)
+                folder_broken: List[tuple[str, str]] = []  # (chemin, cible)
+                folder_checked = 0
+                
+                if not self.use_rich:
+                    self.logger.info(f"[{instance.name}] Analyse: {folder}/")
+                
+                task = progress.add_task(f"Analyse {folder}/", total=None)
+                
+                for link, target in self._check_symlinks(os.fsencode(folder_path), mount_prefix, executor):
+                    folder_checked += 1
+                    if target is not None:
+                        folder_broken.append((os.fsdecode(link), os.fsdecode(target)))
+                    progress.update(task, advance=1)
+                
+                total_checked += folder_checked
+                broken_links.extend(path for path, _ in folder_broken)
+                
+                # Logger en JSON, hors de la boucle de détection
+                for path, target in folder_broken:
+                    self.json_logger.log_broken(
+                        path=path,
+                        target=target,
+                        instance=instance.name,
+                        category=instance.category
+                    )
+                
+                if not folder_checked:
+                    if self.use_rich:
+                        self.console.print(f"  {folder}/ [dim](aucun symlink)[/dim]")
+                    else:
+                        self.logger.info(f"[{instance.name}]   {folder}/ (aucun symlink)")
+                    continue
+                
+                # Afficher résultat dossier
+                if folder_broken:
+                    if self.use_rich:
+                        self.console.print(f"  [red]✗[/red] {folder}/: {len(folder_broken)} cassé(s) sur {folder_checked}")
+                        for broken, _ in folder_broken:
+                            self.console.print(f"    [red]❌ {broken}[/red]")
+                    else:
+                        self.logger.warning(f"[{instance.name}]   {folder}/: {len(folder_broken)} cassé(s) sur {folder_checked}")
+                        for broken, _ in folder_broken:
+                            self.logger.warning(f"[{instance.name}] [CASSÉ] {broken}")
                 else:
-                    self.logger.info(f"  {folder}/: {len(symlinks)} symlinks OK")
+                    if self.use_rich:
+                        self.console.print(f"  [green]✓[/green] {folder}/: {folder_checked} symlinks OK")
+                    else:
+                        self.logger.info(f"[{instance.name}]   {folder}/: {folder_checked} symlinks OK")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         # Log résultat instance
         if self.use_rich:
-            self.console.print(f"\n[bold]Résultat:[/bold] {len(broken_links)} cassé(s) sur {total_checked} symlinks\n")
+            self.console.print(f"\n[bold]Résultat {instance.name}:[/bold] {len(broken_links)} cassé(s) sur {total_checked} symlinks\n")
         else:
-            self.logger.info(f"{instance.category.capitalize()}: {len(broken_links)} cassé(s) sur {total_checked}")
+            self.logger.info(f"[{instance.name}] {instance.category.capitalize()}: {len(broken_links)} cassé(s) sur {total_checked}")
         
         self.json_logger.log(
             "scan_completed",
@@ -355,6 +756,7 @@ class SymlinkScanner:
             broken=len(broken_links),
             duration_seconds=round(duration, 2)
         )
+        self.json_logger.flush()
         
         return ScanResult(
             instance=instance.name,
@@ -364,39 +766,90 @@ class SymlinkScanner:
             duration=duration
         )
     
-    def _is_broken_symlink(self, path: Path, mount_target: Path) -> bool:
-        """Vérifie si un symlink est cassé et pointe vers le bon montage"""
+    def _check_symlinks(self, root: bytes, mount_prefix: bytes, executor: Optional[ThreadPoolExecutor] = None) -> Iterator[tuple[bytes, Optional[bytes]]]:
+        """
+        Parcourt root et émet (symlink, cible si cassé sinon None)
+        
+        Avec un executor, les symlinks sont vérifiés par lots de
+        CHECK_BATCH_SIZE dans le pool (readlink/stat libèrent le GIL). Les
+        vérifications se font alors par chemin complet: le dir_fd émis par
+        iter_symlinks n'est valide que jusqu'à l'élément suivant.
+        """
+        # Résolu une fois: boucle chaude appelée pour chaque symlink
+        broken_target = self._broken_target
+        
+        if executor is None:
+            for dir_fd, name, link in iter_symlinks(root, self.use_dir_fd):
+                yield link, broken_target(name, mount_prefix, dir_fd)
+            return
+        
+        links = (link for _, _, link in iter_symlinks(root))
+        while batch := list(islice(links, CHECK_BATCH_SIZE)):
+            yield from zip(batch, executor.map(broken_target, batch, repeat(mount_prefix)))
+    
+    def _broken_target(self, path: bytes, mount_prefix: bytes, dir_fd: Optional[int] = None) -> Optional[bytes]:
+        """
+        Vérifie si un symlink est cassé et pointe vers le bon montage
         
+        Args:
+            path: Chemin du symlink, relatif à dir_fd si fourni
+        
+        Returns:
+            Cible du symlink s'il est cassé, None sinon
+        """
+        
+        # Lire la cible du symlink
         try:
-            # Lire la cible du symlink
-            target = path.readlink()
-            
-            # Vérifier si pointe vers le montage cible
-            if not str(target).startswith(str(mount_target)):
-                return False
-            
-            # Tester si cassé
-            if not path.exists():
-                # Logger en JSON
-                self.json_logger.log_broken(
-                    path=path,
-                    target=target,
-                    instance="",  # Sera rempli par le contexte appelant
-                    category=""
-                )
-                return True
-            
-            return False
-            
-        except (OSError, RuntimeError):
-            # Erreur de lecture du symlink
-            return False
+            target = os.readlink(path, dir_fd=dir_fd)
+        except OSError:
+            return None
+        
+        # Vérifier si pointe vers le montage cible: les symlinks étrangers
+        # (copies locales, posters, NFO) sont écartés ici, sans stat
+        if not target.startswith(mount_prefix):
+            return None
+        
+        # Tester si cassé: stat suit le lien et échoue si la cible n'existe pas
+        try:
+            os.stat(path, dir_fd=dir_fd)
+            return None
+        except OSError as e:
+            if e.errno not in BROKEN_TARGET_ERRNOS:
+                # Erreur d'accès à la cible (permissions, montage en erreur)
+                return None
+        
+        return target
 
 
 # ============================================================================
 # CLEANER
 # ============================================================================
 
+@contextmanager
+def open_dir_fd(path: str) -> Iterator[Optional[int]]:
+    """
+    Ouvre un dossier pour les opérations relatives (dir_fd)
+    
+    Évite la résolution du chemin complet à chaque suppression dans un même
+    dossier. Produit None si dir_fd n'est pas supporté ou si l'ouverture
+    échoue: l'appelant utilise alors les chemins complets.
+    """
+    if os.unlink not in os.supports_dir_fd or os.lstat not in os.supports_dir_fd:
+        yield None
+        return
+    
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        yield None
+        return
+    
+    try:
+        yield fd
+    finally:
+        os.close(fd)
+
+
 class SymlinkCleaner:
     """Gestionnaire de suppression de symlinks"""
     
@@ -406,7 +859,7 @@ class SymlinkCleaner:
         self.use_rich = use_rich
         
         if use_rich:
-            self.console = Console(stderr=True)
+            self.console = get_console()
     
     def confirm_deletion(self, total: int, auto_yes: bool) -> bool:
         """Demande confirmation pour la suppression"""
@@ -443,37 +896,50 @@ class SymlinkCleaner:
         api_clients = {}
         enable_api = config.scan_options.get('enable_api_actions', False)
         
-        if enable_api and API_CLIENT_AVAILABLE:
+        api = load_api_client() if enable_api else None
+        
+        if api:
             for instance in config.instances:
                 if instance.api_url and instance.api_key:
-                    api_config = ArrConfig(
+                    api_config = api.ArrConfig(
                         name=instance.name,
                         category=instance.category,
                         api_url=instance.api_url,
                         api_key=instance.api_key
                     )
-                    api_clients[instance.name] = ArrAPIClient(api_config)
+                    api_clients[instance.name] = api.ArrAPIClient(api_config)
                     self.logger.info(f"Client API activé pour: {instance.name}")
         
-        # Supprimer et traiter via API
+        # 1. Supprimer les symlinks
+        deleted_links: Dict[str, List[str]] = {}
+        
         for result in results:
-            api_client = api_clients.get(result.instance)
+            instance_deleted = deleted_links.setdefault(result.instance, [])
             
-            for link in result.broken_links:
-                # 1. Supprimer le symlink
-                if self._delete_file(link):
-                    deleted += 1
-                    
-                    # 2. Déclencher actions API si disponible
-                    if api_client:
-                        try:
-                            if api_client.process_broken_symlink(str(link)):
-                                api_triggered += 1
-                                self.logger.info(f"Actions API déclenchées pour: {link.name}")
-                        except Exception as e:
-                            self.logger.error(f"Erreur API pour {link}: {e}")
-                else:
-                    failed += 1
+            # Liens regroupés par dossier: unlink relatif à un fd de dossier
+            for parent, links in groupby(result.broken_links, key=os.path.dirname):
+                with open_dir_fd(parent) as dir_fd:
+                    for link in links:
+                        if self._delete_file(link, dir_fd):
+                            deleted += 1
+                            instance_deleted.append(link)
+                        else:
+                            failed += 1
+        
+        # 2. Déclencher les actions API, instances en parallèle (réseau)
+        api_jobs = {
+            name: links for name, links in deleted_links.items()
+            if links and name in api_clients
+        }
+        
+        if api_jobs:
+            with ThreadPoolExecutor(max_workers=len(api_jobs)) as executor:
+                futures = [
+                    executor.submit(self._trigger_api_actions, name, api_clients[name], links)
+                    for name, links in api_jobs.items()
+                ]
+                for future in as_completed(futures):
+                    api_triggered += future.result()
         
         self.logger.info(f"Suppression terminée: {deleted} réussis, {failed} échecs")
         if api_triggered > 0:
@@ -482,14 +948,44 @@ class SymlinkCleaner:
         self.json_logger.log("deletion_completed", deleted=deleted, failed=failed, api_triggered=api_triggered)
         
         return deleted if failed == 0 else -1
-
     
-    def _delete_file(self, path: Path) -> bool:
-        """Supprime un fichier"""
+    def _trigger_api_actions(self, instance_name: str, api_client: "ArrAPIClient", links: List[str]) -> int:
+        """Résout les médias des symlinks supprimés et lance Refresh + Search groupés"""
+        
+        # IDs dédoublonnés, dans l'ordre des liens
+        ids: Dict[int, None] = {}
+        
+        # Une erreur sur un lien n'empêche pas les actions pour les autres
+        for link in links:
+            try:
+                item_id = api_client.resolve_item_id(link)
+            except Exception as e:
+                self.logger.error(f"Erreur API pour {link}: {e}")
+                continue
+            if item_id:
+                ids[item_id] = None
+        
+        if not ids:
+            return 0
+        
+        try:
+            if api_client.process_item_ids(list(ids)):
+                self.logger.info(f"Actions API déclenchées pour {len(ids)} média(s) ({instance_name})")
+                return len(ids)
+        except Exception as e:
+            self.logger.error(f"Erreur API pour {instance_name}: {e}")
+        
+        return 0
+    
+    def _delete_file(self, path: str, dir_fd: Optional[int] = None) -> bool:
+        """Supprime un symlink (os.unlink direct, relatif à dir_fd si fourni)"""
+        
+        name = os.path.basename(path) if dir_fd is not None else path
         
         try:
-            if path.is_symlink():
-                path.unlink()
+            # Un seul lstat: ne jamais supprimer un fichier qui a remplacé le lien
+            if stat.S_ISLNK(os.lstat(name, dir_fd=dir_fd).st_mode):
+                os.unlink(name, dir_fd=dir_fd)
                 if self.use_rich:
                     self.console.print(f"[green]✓[/green] Supprimé: {path}")
                 else:
@@ -497,19 +993,24 @@ class SymlinkCleaner:
                 
                 self.json_logger.log(
                     "symlink_deleted",
-                    path=str(path)
+                    path=path
                 )
                 return True
             else:
                 self.logger.warning(f"Ignoré (plus un symlink): {path}")
                 return False
-                
+        
+        except FileNotFoundError:
+            # Supprimé entre le lstat et l'unlink
+            self.logger.warning(f"Ignoré (déjà supprimé): {path}")
+            return False
+        
         except OSError as e:
             self.logger.error(f"Échec suppression: {path} ({e})")
             self.json_logger.log(
                 "deletion_failed",
                 level="ERROR",
-                path=str(path),
+                path=path,
                 error=str(e)
             )
             return False
@@ -519,61 +1020,107 @@ class SymlinkCleaner:
 # MAIN
 # ============================================================================
 
-def show_summary(results: List[ScanResult], execute_mode: bool, use_rich: bool):
-    """Affiche le résumé final"""
+# Rappel des commandes de suppression (dry-run avec cassés)
+_DELETE_HINT_RICH = (
+    "[dim]Pour supprimer ces symlinks:[/dim]\n"
+    "[dim]  python manage_broken_symlinks.py --execute          # avec confirmation[/dim]\n"
+    "[dim]  python manage_broken_symlinks.py --execute --yes    # automatique (cron)[/dim]\n"
+)
+_DELETE_HINT_PLAIN = (
+    "\nPour supprimer ces symlinks:\n"
+    "  python manage_broken_symlinks.py --execute          # avec confirmation\n"
+    "  python manage_broken_symlinks.py --execute --yes    # automatique (cron)\n"
+)
+
+
+def aggregate_results(results: List[ScanResult]) -> tuple[int, int]:
+    """Totaux (analysés, cassés) en un seul passage sur les résultats"""
+    
+    total_checked = 0
+    total_broken = 0
+    
+    for result in results:
+        total_checked += result.total_checked
+        total_broken += result.broken_count
+    
+    return total_checked, total_broken
+
+
+def show_summary(results: List[ScanResult], execute_mode: bool, use_rich: bool, total_duration: float) -> int:
+    """
+    Affiche le résumé final et retourne le total de symlinks cassés
+    
+    Les instances au montage figé sont signalées comme non analysées.
+    total_duration est la durée réelle du scan: les durées des instances
+    scannées en parallèle se chevauchent et ne s'additionnent pas.
+    """
     
-    total_checked = sum(r.total_checked for r in results)
-    total_broken = sum(r.broken_count for r in results)
-    total_duration = sum(r.duration for r in results)
+    total_checked, total_broken = aggregate_results(results)
+    stalled = [result.instance for result in results if result.stalled]
+    
+    # Cas courant en cron (rien de cassé ni figé, pas de terminal): une seule ligne
+    if total_broken == 0 and not stalled and not _STDERR_ISATTY:
+        _LOGGER.info(f"OK: {total_checked} symlinks analysés, aucun cassé ({total_duration:.1f}s)")
+        return total_broken
     
     if use_rich:
-        console = Console(stderr=True)
-        console.print("\n[bold cyan]═══ RÉSUMÉ ═══[/bold cyan]\n")
-        
-        table = Table(show_header=True, header_style="bold cyan", box=box.SIMPLE)
-        table.add_column("Instance", style="yellow")
-        table.add_column("Catégorie", style="magenta")
-        table.add_column("Analysés", justify="right")
-        table.add_column("Cassés", justify="right", style="red")
-        
-        for result in results:
-            table.add_row(
-                result.instance,
-                result.category,
-                str(result.total_checked),
-                str(result.broken_count)
-            )
+        rich = load_rich()
+        console = get_console()
         
-        console.print(table)
-        console.print(f"\n[bold]Total analysés:[/bold] {total_checked} symlinks")
-        console.print(f"[bold]Total cassés:[/bold] {total_broken}")
-        console.print(f"[bold]Durée:[/bold] {total_duration:.1f}s\n")
+        # Rendu capturé puis écrit en un seul write sur stderr
+        with console.capture() as capture:
+            console.print("\n[bold cyan]═══ RÉSUMÉ ═══[/bold cyan]\n")
+            
+            table = rich.Table(show_header=True, header_style="bold cyan", box=rich.box.SIMPLE)
+            table.add_column("Instance", style="yellow")
+            table.add_column("Catégorie", style="magenta")
+            table.add_column("Analysés", justify="right")
+            table.add_column("Cassés", justify="right", style="red")
+            
+            for result in results:
+                table.add_row(
+                    result.instance,
+                    result.category,
+                    "-" if result.stalled else str(result.total_checked),
+                    "montage figé" if result.stalled else str(result.broken_count)
+                )
+            
+            console.print(table)
+            console.print(f"\n[bold]Total analysés:[/bold] {total_checked} symlinks")
+            console.print(f"[bold]Total cassés:[/bold] {total_broken}")
+            if stalled:
+                console.print(f"[bold red]Montages figés (non analysés):[/bold red] {', '.join(stalled)}")
+            console.print(f"[bold]Durée:[/bold] {total_duration:.1f}s\n")
+            
+            if not execute_mode and total_broken > 0:
+                console.print(_DELETE_HINT_RICH)
         
-        if not execute_mode and total_broken > 0:
-            console.print("[dim]Pour supprimer ces symlinks:[/dim]")
-            console.print("[dim]  python manage_broken_symlinks.py --execute          # avec confirmation[/dim]")
-            console.print("[dim]  python manage_broken_symlinks.py --execute --yes    # automatique (cron)[/dim]\n")
+        sys.stderr.write(capture.get())
+        sys.stderr.flush()
     else:
-        logger = logging.getLogger('broken-symlinks')
-        logger.info("=== RÉSUMÉ ===")
-        logger.info(f"Total analysés: {total_checked} symlinks")
-        
-        for result in results:
-            logger.info(f"{result.category.capitalize()}: {result.broken_count} cassé(s) sur {result.total_checked}")
-        
-        logger.info(f"TOTAL CASSÉS: {total_broken}")
-        logger.info(f"Durée: {total_duration:.1f}s")
+        # Un seul enregistrement multi-lignes plutôt qu'un par ligne
+        lines = ["=== RÉSUMÉ ===", f"Total analysés: {total_checked} symlinks"]
+        lines.extend(
+            f"{result.category.capitalize()}: montage figé, non analysé" if result.stalled
+            else f"{result.category.capitalize()}: {result.broken_count} cassé(s) sur {result.total_checked}"
+            for result in results
+        )
+        lines.append(f"TOTAL CASSÉS: {total_broken}")
+        if stalled:
+            lines.append(f"MONTAGES FIGÉS (non analysés): {', '.join(stalled)}")
+        lines.append(f"Durée: {total_duration:.1f}s")
+        _LOGGER.info("\n".join(lines))
         
         if not execute_mode and total_broken > 0:
-            print("\nPour supprimer ces symlinks:", file=sys.stderr)
-            print("  python manage_broken_symlinks.py --execute          # avec confirmation", file=sys.stderr)
-            print("  python manage_broken_symlinks.py --execute --yes    # automatique (cron)", file=sys.stderr)
+            sys.stderr.write(_DELETE_HINT_PLAIN)
+            sys.stderr.flush()
+    
+    return total_broken
 
 
-def main():
-    """Point d'entrée principal"""
+def build_parser() -> argparse.ArgumentParser:
+    """Parser argparse complet (aide, erreurs d'usage)"""
     
-    # Parse arguments
     parser = argparse.ArgumentParser(
         description="Scanner et nettoyeur de symlinks cassés pour médiathèque Plex/Decypharr"
     )
@@ -590,18 +1137,65 @@ def main():
     parser.add_argument(
         '--config',
         type=Path,
-        default=Path(__file__).parent / 'config.yaml',
+        default=_DEFAULT_CONFIG,
         help="Chemin vers le fichier de configuration (défaut: config.yaml)"
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help="Threads de vérification des symlinks par instance (défaut: scan_options.workers)"
+    )
+    
+    return parser
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse les arguments sans construire de parser dans le cas courant
     
-    args = parser.parse_args()
+    Seules les formes exactes des options sont reconnues ici; tout autre
+    argument (--help, abréviation, option inconnue) passe par argparse, qui
+    conserve son aide et ses messages d'erreur.
+    """
+    args = argparse.Namespace(execute=False, yes=False, config=_DEFAULT_CONFIG, workers=None)
+    
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '--execute':
+            args.execute = True
+        elif arg in ('--yes', '-y'):
+            args.yes = True
+        elif arg == '--config' and i + 1 < len(argv) and not argv[i + 1].startswith('-'):
+            args.config = Path(argv[i + 1])
+            i += 1
+        elif arg.startswith('--config=') and len(arg) > len('--config='):
+            args.config = Path(arg[len('--config='):])
+        elif arg == '--workers' and i + 1 < len(argv) and argv[i + 1].isdecimal():
+            args.workers = int(argv[i + 1])
+            i += 1
+        elif arg.startswith('--workers=') and arg[len('--workers='):].isdecimal():
+            args.workers = int(arg[len('--workers='):])
+        else:
+            return build_parser().parse_args(argv)
+        i += 1
+    
+    return args
+
+
+def main():
+    """Point d'entrée principal"""
+    
+    # Parse arguments
+    args = parse_args(sys.argv[1:])
     
     # Charger configuration
     try:
-        config = Config.from_yaml(args.config)
+        config = Config.load(args.config)
     except FileNotFoundError:
         print(f"[ERROR] Fichier de configuration introuvable: {args.config}", file=sys.stderr)
-        print(f"[ERROR] Créez le fichier config.yaml dans {Path(__file__).parent}", file=sys.stderr)
+        print(f"[ERROR] Créez le fichier config.yaml dans {_HERE}", file=sys.stderr)
         return 1
     except Exception as e:
         print(f"[ERROR] Erreur lors du chargement de la configuration: {e}", file=sys.stderr)
@@ -610,23 +1204,32 @@ def main():
     # Setup logging
     logger, json_logger = setup_logging(config)
     
+    try:
+        return run(args, config, logger, json_logger)
+    finally:
+        json_logger.close()
+
+
+def run(args: argparse.Namespace, config: Config, logger: logging.Logger, json_logger: JSONLogger) -> int:
+    """Exécute la session de scan (et de suppression) et retourne l'exit code"""
+    
     # Header
-    use_rich = RICH_AVAILABLE and sys.stderr.isatty() and config.scan_options.get('show_progress', True)
+    use_rich = rich_enabled(config)
     
     if use_rich:
-        console = Console(stderr=True)
-        console.print(Panel.fit(
+        rich = load_rich()
+        get_console().print(rich.Panel.fit(
             "[bold cyan]Scan des symlinks cassés - Médiathèque Plex[/bold cyan]",
-            box=box.DOUBLE
+            box=rich.box.DOUBLE
         ))
     else:
         logger.info("=== DÉTECTION SYMLINKS CASSÉS ===")
-        logger.info(f"Démarrage: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"Démarrage: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     
     mode = "SUPPRESSION" if args.execute else "VÉRIFICATION (dry-run)"
     
     if use_rich:
-        console.print(f"\n[bold]Mode:[/bold] {mode}\n")
+        get_console().print(f"\n[bold]Mode:[/bold] {mode}\n")
     else:
         logger.info(f"Mode: {mode}")
     
@@ -637,25 +1240,30 @@ def main():
     )
     
     # Vérifications
-    scanner = SymlinkScanner(config, logger, json_logger)
+    scanner = SymlinkScanner(config, logger, json_logger, use_rich, workers=args.workers)
     
     if not scanner.check_prerequisites():
         return 1
     
     # Scan toutes les instances
-    results: List[ScanResult] = []
-    
-    for instance in config.instances:
-        result = scanner.scan_instance(instance)
-        results.append(result)
+    scan_start = time.monotonic()
+    results = scanner.scan_all()
+    scan_duration = time.monotonic() - scan_start
     
     # Résumé
-    show_summary(results, args.execute, use_rich)
+    total_broken = show_summary(results, args.execute, use_rich, scan_duration)
     
-    total_broken = sum(r.broken_count for r in results)
+    # Montage figé: erreur technique (exit 1), même si les autres instances
+    # sont traitées normalement
+    stalled = [result.instance for result in results if result.stalled]
+    if stalled:
+        logger.error(f"Montage(s) figé(s), non analysé(s): {', '.join(stalled)}")
     
     # Exit si aucun cassé
     if total_broken == 0:
+        if stalled:
+            json_logger.log("scan_session_completed", broken_found=False, stalled_mounts=stalled)
+            return 1
         logger.info("Aucun symlink cassé détecté")
         json_logger.log("scan_session_completed", broken_found=False)
         return 0
@@ -670,18 +1278,18 @@ def main():
             if deleted_count >= 0:
                 logger.info("Nettoyage terminé avec succès")
                 json_logger.log("scan_session_completed", broken_found=True, deleted=True, count=deleted_count)
-                return 3
+                return 1 if stalled else 3
             else:
                 logger.error("Erreurs lors de la suppression")
                 json_logger.log("scan_session_completed", broken_found=True, deleted=False, errors=True)
                 return 1
         else:
             json_logger.log("scan_session_completed", broken_found=True, deleted=False, user_cancelled=True)
-            return 2
+            return 1 if stalled else 2
     else:
         logger.info("Mode dry-run: aucune suppression effectuée")
         json_logger.log("scan_session_completed", broken_found=True, deleted=False, dry_run=True)
-        return 2
+        return 1 if stalled else 2
 
 
 if __name__ == '__main__':